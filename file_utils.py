@@ -8,11 +8,104 @@
 @CreatedOn  : 2020/10/30 19:26
 --------------------------------------
 """
+from sys import stdout
 from time import time
-from os import makedirs, listdir, remove
-from os.path import isdir, splitext, exists, join as path_join, getctime, getsize
-from shutil import copy, move, rmtree
+from os import (makedirs, remove, unlink, scandir, stat, fstat, cpu_count, fsencode, close, O_RDONLY, supports_dir_fd,
+                open as os_open)
+from os.path import abspath, basename, dirname, exists, join as path_join, getsize, samefile
+from shutil import copyfile, copyfileobj, move, rmtree, SameFileError, SpecialFileError
+from stat import S_ISFIFO
 from zipfile import ZipFile
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED, FIRST_EXCEPTION
+from functools import lru_cache, partial
+from collections import defaultdict, deque
+
+# 文件复制、移动、删除等 I/O 密集型任务的默认线程数
+DEFAULT_IO_WORKERS = min(32, (cpu_count() or 1) * 4)
+
+# 进度条满格时的字符串，按进度截取
+PROGRESS_BAR = '=' * 50
+PROGRESS_TEMPLATE = '[%-50s]%.2f%% | %d/%d | %s'
+
+# 内核复制时每次系统调用复制的最大、最小字节数
+COPY_CHUNK_SIZE = 1 << 30
+COPY_MIN_CHUNK_SIZE = 1 << 23
+
+# remove_files 中每个任务删除的文件数上限
+REMOVE_BATCH_SIZE = 256
+
+# unzip_parallel 中每个子进程任务解压的成员数
+UNZIP_CHUNK_SIZE = 64
+
+try:
+    # Windows 不支持按目录句柄删除文件
+    from os import O_DIRECTORY
+    _REMOVE_WITH_DIR_FD = unlink in supports_dir_fd
+except ImportError:
+    O_DIRECTORY = 0
+    _REMOVE_WITH_DIR_FD = False
+
+try:
+    # 仅 Linux(Python 3.8+) 提供
+    from os import copy_file_range as _copy_file_range, sendfile
+except ImportError:
+    _copy_file_range = None
+
+
+@lru_cache(maxsize=1024)
+def _cached_scan(abs_dir_path: str, mtime_ns: int) -> tuple:
+    """
+    读取目录条目，返回 ((文件名, 是否目录), ...)。
+    mtime_ns 参与缓存键，目录内有增删改名时 mtime 变化，自动重新扫描。
+    """
+    with scandir(abs_dir_path) as it:
+        return tuple((entry.name, entry.is_dir()) for entry in it)
+
+
+def _copy_file_range_loop(src_fd: int, dst_fd: int, size: int):
+    """
+    用 os.copy_file_range 从文件当前位置复制到文件末尾。
+    size 只用来决定每次复制的字节数：/proc、sysfs 等文件大小为 0 但有内容，须复制到返回 0 为止
+    """
+    chunk = min(max(size, COPY_MIN_CHUNK_SIZE), COPY_CHUNK_SIZE)
+    while _copy_file_range(src_fd, dst_fd, chunk):
+        pass
+
+
+def _sendfile_loop(src_fd: int, dst_fd: int, size: int):
+    """用 os.sendfile 从源文件开头复制到文件末尾，size 的用法同 _copy_file_range_loop"""
+    chunk = min(max(size, COPY_MIN_CHUNK_SIZE), COPY_CHUNK_SIZE)
+    offset = 0
+    while True:
+        n = sendfile(dst_fd, src_fd, offset, chunk)
+        if not n:
+            break
+        offset += n
+
+
+def _extract_members(zip_path: str, dst_dir: str, members: list):
+    """unzip_parallel 的子进程任务：每个进程自行打开压缩文件，解压其中的一批成员"""
+    with ZipFile(zip_path, 'r') as f:
+        for member in members:
+            f.extract(member, dst_dir)
+
+
+def _member_parts(filename: str) -> list:
+    """按 ZipFile.extract 的规则拆分成员名：去掉空、'.'、'..' 等路径片段"""
+    return [i for i in filename.split('/') if i not in ('', '.', '..')]
+
+
+def _make_member_dirs(infos: list, dst_dir: str):
+    """创建 dst_dir 及压缩文件成员 infos 解压时需要的所有目录"""
+    dirs = {dst_dir}
+    for info in infos:
+        parts = _member_parts(info.filename)
+        dir_parts = parts if info.is_dir() else parts[:-1]
+        if dir_parts:
+            dirs.add(path_join(dst_dir, *dir_parts))
+
+    for dir_path in dirs:
+        makedirs(dir_path, exist_ok=True)
 
 
 class FileUtils:
@@ -34,64 +127,268 @@ class FileUtils:
         makedirs(dir_path)
 
     @classmethod
-    def copy_files(cls, src_dir: str, dst_dir: str, depth=0, suffix=None, key_str: str = None):
+    def copy_files(cls, src_dir: str, dst_dir: str, depth=0, suffix=None, key_str: str = None,
+                   max_workers: int = DEFAULT_IO_WORKERS):
         """
         复制指定目录 src_dir下的文件到 dst_dir目录
             depth：  src_dir递归查找深度，0: 当前目录，1:子目录，...
             suffix: 搜索指定后缀的文件,None,表示所有文件
             key_str: 搜索路径中含特定字符的路径，None,表示没有特定字符
+            max_workers: 并发复制的线程数，1 表示逐个复制，None 表示默认线程数
+            注意：只复制文件内容，不复制权限位
         """
-        for file in cls.list_paths(src_dir, depth=depth, suffix=suffix, key_str=key_str):
-            # 复制文件到目录
-            copy(file, dst_dir)
+        files = cls.list_paths(src_dir, depth=depth, suffix=suffix, key_str=key_str)
+        # 复制文件到目录，同名文件在同一个任务中按顺序复制，与逐个复制的结果一致
+        cls._map_parallel(
+            lambda group: [cls._copy_file(file, path_join(dst_dir, basename(file))) for file in group],
+            cls._group_by_basename(files),
+            max_workers
+        )
 
     @classmethod
-    def move_files(cls, src_dir: str, dst_dir: str, depth=0, suffix=None):
+    def move_files(cls, src_dir: str, dst_dir: str, depth=0, suffix=None, max_workers: int = DEFAULT_IO_WORKERS):
         """
         移动指定目录 src_dir下的文件到 dst_dir目录
             depth：  src_dir递归查找深度，0: 当前目录，1:子目录，...
                     注意：所有文件都在 dst_dir下同一级
             suffix: 搜索指定后缀的文件,None,表示所有文件
+            max_workers: 并发移动的线程数，1 表示逐个移动，None 表示默认线程数
         """
-        for file in cls.list_paths(src_dir, depth, suffix):
-            # 复制文件到目录
-            move(file, dst_dir)
+        # 移动文件到目录，同名文件在同一个任务中按顺序移动，后移动的会因目标已存在而报错
+        cls._map_parallel(
+            lambda group: [move(file, dst_dir) for file in group],
+            cls._group_by_basename(cls.list_paths(src_dir, depth, suffix)),
+            max_workers
+        )
 
     @classmethod
-    def remove_files(cls, src_dir: str, depth=0, suffix=None):
+    def remove_files(cls, src_dir: str, depth=0, suffix=None, max_workers: int = DEFAULT_IO_WORKERS):
         """
         删除指定目录 src_dir下的所有文件
             depth：  src_dir递归查找深度，0: 当前目录，1:子目录，...
                     注意：所有文件都在 dst_dir下同一级
             suffix: 搜索指定后缀的文件,None,表示所有文件
+            max_workers: 并发删除的线程数，1 表示逐个删除，None 表示默认线程数
         """
+        # 按所在目录分组，每批文件共用一个目录句柄
+        batches = defaultdict(list)
         for file in cls.list_paths(src_dir, depth, suffix):
-            # 复制文件到目录
-            remove(file)
+            batches[dirname(file)].append(basename(file))
+
+        tasks = (
+            (dir_path, names[i:i + REMOVE_BATCH_SIZE])
+            for dir_path, names in batches.items()
+            for i in range(0, len(names), REMOVE_BATCH_SIZE)
+        )
+        cls._map_parallel(lambda task: cls._remove_in_dir(*task), tasks, max_workers)
 
     @classmethod
-    def unzip(cls, zip_path: str, dst_dir: str = './'):
-        """解压单个zip压缩文件到 dst目录"""
+    def unzip(cls, zip_path: str, dst_dir: str = './', show_progress: bool = True):
+        """
+        解压单个zip压缩文件到 dst目录，进度按已解压成员的压缩后大小显示
+            show_progress: 是否显示进度条
+        """
         with ZipFile(zip_path, 'r') as f:
-            files = f.namelist()
-            file_length = len(files)
+            if not show_progress:
+                f.extractall(dst_dir)
+                return
+
+            infos = f.infolist()
+            total = sum(info.compress_size for info in infos) or 1
+            portion = 0
+            last_pct = -1
 
-            for no, i in enumerate(files, 1):
-                f.extract(i, dst_dir)
-                cls.__progress_bar(no, file_length, zip_path)
+            for info in infos:
+                f.extract(info, dst_dir)
+                portion += info.compress_size
+
+                # 整数百分比变化时才刷新进度条
+                pct = portion * 100 // total
+                if pct != last_pct:
+                    last_pct = pct
+                    cls.__progress_bar(portion, total, zip_path)
+
+            if last_pct != 100:
+                cls.__progress_bar(total, total, zip_path)
+
+    @staticmethod
+    def unzip_parallel(zip_path: str, dst_dir: str = './', max_workers: int = None):
+        """
+        用多进程解压单个zip压缩文件到 dst目录，适合成员多、压缩率高等解压耗CPU的文件。
+        不显示进度条。Windows/macOS 下调用方需放在 if __name__ == '__main__': 之后。
+            max_workers: 进程数，None 表示 CPU 核数
+        """
+        with ZipFile(zip_path, 'r') as f:
+            infos = f.infolist()
+
+        # 先在主进程中创建所有成员的上级目录，子进程解压时就不会同时创建同一个目录
+        _make_member_dirs(infos, dst_dir)
+
+        members = [info.filename for info in infos]
+        chunks = [members[i:i + UNZIP_CHUNK_SIZE] for i in range(0, len(members), UNZIP_CHUNK_SIZE)]
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # 消费结果，以便把子进程中的异常抛给调用方
+            for _ in executor.map(partial(_extract_members, zip_path, dst_dir), chunks):
+                pass
 
     @classmethod
-    def unzips(cls, src: str, dst: str):
-        """解压src目录下的zip文件，到dst目录"""
+    def unzips(cls, src: str, dst: str, max_workers: int = DEFAULT_IO_WORKERS):
+        """
+        解压src目录下的zip文件，到dst目录
+            max_workers: 同时解压的zip文件数，1 表示逐个解压，None 表示默认线程数。
+                         每个zip文件只由一个线程处理，含相同成员路径的zip文件按顺序解压。
+                         多个文件同时解压时不显示进度条。
+        """
         zip_files = cls.list_paths(src, suffix='zip')
-        if zip_files:
+
+        if max_workers is not None and max_workers <= 1:
             for z_file in zip_files:
                 cls.unzip(z_file, dst)
+            return
+
+        # 先读出各文件的成员，创建所有上级目录，避免多个线程同时创建同一个目录；
+        # 有相同成员路径的zip文件并到一组(并查集)，组内按顺序解压，与逐个解压一样后解压的覆盖先解压的
+        zip_files = list(zip_files)
+        parent = list(range(len(zip_files)))
+        owner = {}  # 成员路径 -> 第一个包含它的zip文件序号
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        for no, z_file in enumerate(zip_files):
+            with ZipFile(z_file, 'r') as f:
+                infos = f.infolist()
+
+            _make_member_dirs(infos, dst)
+
+            for info in infos:
+                if info.is_dir():
+                    continue
+
+                member = '/'.join(_member_parts(info.filename))
+                if member in owner:
+                    parent[find(no)] = find(owner[member])
+                else:
+                    owner[member] = no
+
+        groups = defaultdict(list)
+        for no, z_file in enumerate(zip_files):
+            groups[find(no)].append(z_file)
+
+        cls._map_parallel(
+            lambda group: [cls.unzip(z_file, dst, show_progress=False) for z_file in group],
+            groups.values(),
+            max_workers
+        )
+
+    @staticmethod
+    def _copy_file(src: str, dst: str):
+        """
+        复制单个文件的内容，不复制权限位。
+        Linux 下在已打开的文件句柄上依次尝试 os.copy_file_range、os.sendfile，数据不经过用户态；
+        都不可用时退回普通的读写复制。其他系统交给 shutil.copyfile(macOS 下使用 fcopyfile)
+        """
+        if _copy_file_range is None:
+            copyfile(src, dst)
+            return
+
+        # 与 shutil.copyfile 相同的检查，必须在以 'wb' 打开(清空) dst 之前进行
+        if exists(dst) and samefile(src, dst):
+            raise SameFileError(f'{src!r} and {dst!r} are the same file')
+
+        for path in (src, dst):
+            try:
+                st = stat(path)
+            except OSError:
+                # 文件不存在等情况，留给下面的 open 报错
+                continue
+
+            if S_ISFIFO(st.st_mode):
+                raise SpecialFileError(f'`{path}` is a named pipe')
+
+        with open(src, 'rb') as f_src, open(dst, 'wb') as f_dst:
+            src_fd, dst_fd = f_src.fileno(), f_dst.fileno()
+            size = fstat(src_fd).st_size
+
+            for kernel_copy in (_copy_file_range_loop, _sendfile_loop):
+                try:
+                    kernel_copy(src_fd, dst_fd, size)
+                    return
+                except OSError:
+                    # 跨文件系统、内核版本过低等情况，清空已写入的内容，换下一种方式
+                    f_src.seek(0)
+                    f_dst.seek(0)
+                    f_dst.truncate()
+
+            copyfileobj(f_src, f_dst)
+
+    @staticmethod
+    def _remove_in_dir(dir_path: str, names: list):
+        """
+        删除 dir_path 目录下的 names 文件。
+        支持 dir_fd 的系统上先打开目录，再按文件名相对删除，省去每个文件的完整路径解析
+        """
+        if not _REMOVE_WITH_DIR_FD:
+            for name in names:
+                remove(path_join(dir_path, name))
+            return
+
+        dir_fd = os_open(dir_path, O_RDONLY | O_DIRECTORY)
+        try:
+            for name in names:
+                unlink(name, dir_fd=dir_fd)
+        finally:
+            close(dir_fd)
+
+    @staticmethod
+    def _group_by_basename(files) -> list:
+        """按文件名分组，返回 [[同名文件路径, ...], ...]，组内保持原有顺序"""
+        groups = defaultdict(list)
+        for file in files:
+            groups[basename(file)].append(file)
+
+        return list(groups.values())
+
+    @staticmethod
+    def _map_parallel(func, iterable, max_workers: int = DEFAULT_IO_WORKERS):
+        """
+        用线程池对 iterable 中的每一项执行 func，任一任务出错时抛出异常。
+        同时提交的任务数有上限，出错后不再提交新任务，并取消尚未开始的任务
+            max_workers: 线程数，None 表示使用 DEFAULT_IO_WORKERS
+        """
+        if max_workers is None:
+            max_workers = DEFAULT_IO_WORKERS
+
+        if max_workers <= 1:
+            for item in iterable:
+                func(item)
+            return
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = set()
+            try:
+                for item in iterable:
+                    if len(pending) >= max_workers * 2:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            future.result()
+
+                    pending.add(executor.submit(func, item))
+
+                done, pending = wait(pending, return_when=FIRST_EXCEPTION)
+                for future in done:
+                    future.result()
+            except BaseException:
+                for future in pending:
+                    future.cancel()
+                raise
 
     @staticmethod
     def __progress_bar(portion, total, file_name):
-        from sys import stdout
-        from math import ceil
         """
         total 总数据大小，portion 已经传送的数据大小
         :param portion: 已经接收的数据量
@@ -101,12 +398,12 @@ class FileUtils:
         # file_name 用于进度条显示文件名，
         # 之前用zip_path全路径，太长
         file_name = file_name.split('/')[-1] or file_name
-        part = total / 50  # 1%数据的大小
-        count = ceil(portion / part)
+        # 整数向上取整，每格代表 2% 的数据
+        count = -(-portion * 50 // total)
         stdout.write('\r')
         stdout.write(
-            ('[%-50s]%.2f%% | %d/%d | %s' % (
-                ('=' * count),
+            (PROGRESS_TEMPLATE % (
+                PROGRESS_BAR[:count],
                 portion / total * 100,
                 portion,
                 total,
@@ -120,48 +417,179 @@ class FileUtils:
             return True
 
     @classmethod
-    def list_paths(cls, dir_path: str, depth: int = 0, suffix=None, key_str: str = None):
+    def list_paths(cls, dir_path: str, depth: int = 0, suffix=None, key_str: str = None, use_cache: bool = False):
         """
         1) Generator。
         2) 遍历 dir_path 目录下的文件的路径。
         3) 注意：这里的路径使用'/'。
+        4) 按层遍历(广度优先)，先返回上层目录中的文件。
         :param dir_path:    str     要遍历的目录路径
         :param depth:       int     扫描的深度 0:当前目录，1：当前目录的下一级目录
-        :param suffix:      str     返回的路径中包含特定后缀，如 ".py" 或者 "py"，默认None，没有后缀限制
+        :param suffix:      str     返回的路径中包含特定后缀，如 ".py" 或者 "py"，多个后缀用 tuple，默认None，没有后缀限制
         :param key_str:     str     返回的路径中包含特定的关键词
+        :param use_cache:   bool    目录修改时间(mtime)未变化时，复用内存中上一次的扫描结果
         """
 
-        # 设定当前目录的表示值
-        current_dir_level = 0
+        suffix = cls._normalize_suffix(suffix)
+        predicate = cls._build_predicate(suffix, key_str)
 
-        if suffix:
-            if not suffix.startswith('.'):
-                suffix = '.' + suffix
+        if not use_cache:
+            for entry in cls._walk(dir_path, depth):
+                if predicate(entry.name, entry.path):
+                    yield entry.path
+            return
 
-        for _path in listdir(dir_path):
-            tmp_path = path_join(dir_path, _path)
+        scan_dir_cached = cls._scan_dir_cached
 
-            if isdir(tmp_path):
-                if current_dir_level < depth:
-                    yield from cls.list_paths(tmp_path, depth - 1, suffix, key_str)
+        # 待扫描的 (目录, 剩余深度)，与 _walk 相同的按层遍历
+        queue = deque([(dir_path, depth)])
+        popleft, append = queue.popleft, queue.append
 
-            else:
-                found = []
-                if suffix:
-                    if splitext(tmp_path)[-1] == suffix:
-                        found.append(True)
-                    else:
-                        found.append(False)
+        while queue:
+            current_dir, remaining = popleft()
 
-                if key_str:
-                    if key_str in tmp_path:
-                        found.append(True)
-                    else:
-                        found.append(False)
+            for tmp_path, name, is_dir in scan_dir_cached(current_dir):
+                if is_dir:
+                    if remaining > 0:
+                        append((tmp_path, remaining - 1))
 
-                if all(found):
+                elif predicate(name, tmp_path):
                     yield tmp_path
 
+    @staticmethod
+    def _walk(dir_path, depth: int = 0):
+        """
+        1) Generator。
+        2) 按层遍历(广度优先) dir_path 目录，返回文件的 os.DirEntry。
+        3) dir_path 为 bytes 时，返回的 DirEntry 的 name、path 也是 bytes。
+        :param dir_path:    str/bytes   要遍历的目录路径
+        :param depth:       int         扫描的深度 0:当前目录，1：当前目录的下一级目录
+        """
+        # 待扫描的 (目录, 剩余深度)，用队列代替递归，不论多深都只有一个生成器
+        queue = deque([(dir_path, depth)])
+        popleft, append = queue.popleft, queue.append
+
+        while queue:
+            current_dir, remaining = popleft()
+
+            with scandir(current_dir) as it:
+                for entry in it:
+                    if entry.is_dir():
+                        if remaining > 0:
+                            append((entry.path, remaining - 1))
+
+                    else:
+                        yield entry
+
+    @classmethod
+    def _normalize_suffix(cls, suffix):
+        """
+        给后缀补上开头的 '.'，便于直接用 endswith 比较
+        :param suffix:  str/bytes/tuple/list    单个后缀，或多个后缀组成的序列
+        :return:        单个后缀返回 str/bytes，多个后缀返回 tuple，空值返回 None。序列中的空值会被忽略
+        """
+        if not suffix:
+            return None
+
+        if isinstance(suffix, (str, bytes)):
+            dot = '.' if isinstance(suffix, str) else b'.'
+            return suffix if suffix.startswith(dot) else dot + suffix
+
+        return tuple(cls._normalize_suffix(i) for i in suffix if i) or None
+
+    @staticmethod
+    def _build_predicate(suffix=None, key_str: str = None):
+        """
+        根据 suffix 和 key_str 生成文件过滤函数 predicate(name, path) -> bool
+        :param suffix:      str     文件名后缀(或多个后缀组成的 tuple)，需已带 '.'，None 表示不限制
+        :param key_str:     str     路径中须包含的关键词，None 表示不限制
+        """
+        if suffix and key_str:
+            return lambda name, path: name.endswith(suffix) and key_str in path
+
+        if suffix:
+            return lambda name, path: name.endswith(suffix)
+
+        if key_str:
+            return lambda name, path: key_str in path
+
+        return lambda name, path: True
+
+    @staticmethod
+    def _scan_dir(dir_path: str) -> list:
+        """读取单个目录的全部条目，返回 [(路径, 文件名, 是否目录), ...]"""
+        with scandir(dir_path) as it:
+            return [(entry.path, entry.name, entry.is_dir()) for entry in it]
+
+    @staticmethod
+    def _scan_dir_cached(dir_path: str) -> list:
+        """同 _scan_dir，目录的 mtime 未变化时直接使用缓存的结果"""
+        names = _cached_scan(abspath(dir_path), stat(dir_path).st_mtime_ns)
+        return [(path_join(dir_path, name), name, is_dir) for name, is_dir in names]
+
+    @classmethod
+    def list_paths_bytes(cls, dir_path, depth: int = 0, suffix=None, key_str=None):
+        """
+        1) Generator。
+        2) 与 list_paths 相同，但全程使用 bytes 路径，省去每次系统调用时的编解码，
+           返回的路径可直接传给 os.remove、shutil.copy 等函数。
+        :param dir_path:    str/bytes   要遍历的目录路径
+        :param depth:       int         扫描的深度 0:当前目录，1：当前目录的下一级目录
+        :param suffix:      str/bytes   返回的路径中包含特定后缀，如 ".py" 或者 "py"，多个后缀用 tuple，默认None，没有后缀限制
+        :param key_str:     str/bytes   返回的路径中包含特定的关键词
+        """
+        if suffix:
+            suffix = cls._normalize_suffix(
+                fsencode(suffix) if isinstance(suffix, (str, bytes)) else tuple(fsencode(i) for i in suffix if i))
+
+        if key_str:
+            key_str = fsencode(key_str)
+
+        predicate = cls._build_predicate(suffix, key_str)
+
+        for entry in cls._walk(fsencode(dir_path), depth):
+            if predicate(entry.name, entry.path):
+                yield entry.path
+
+    @classmethod
+    def list_paths_parallel(cls, dir_path: str, depth: int = 0, suffix=None, key_str: str = None,
+                            max_workers: int = 16):
+        """
+        1) Generator。
+        2) 与 list_paths 相同，但用线程池并发读取各级子目录，适用于 NFS/SMB 等高延迟文件系统。
+        3) 注意：返回路径的顺序不固定。
+        :param dir_path:    str     要遍历的目录路径
+        :param depth:       int     扫描的深度 0:当前目录，1：当前目录的下一级目录
+        :param suffix:      str     返回的路径中包含特定后缀，如 ".py" 或者 "py"，多个后缀用 tuple，默认None，没有后缀限制
+        :param key_str:     str     返回的路径中包含特定的关键词
+        :param max_workers: int     同时读取的目录数上限，同时也限制了打开的目录句柄数
+        """
+
+        suffix = cls._normalize_suffix(suffix)
+
+        predicate = cls._build_predicate(suffix, key_str)
+
+        _scan_dir = cls._scan_dir
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            submit = executor.submit
+            # future -> 该目录剩余的扫描深度
+            pending = {submit(_scan_dir, dir_path): depth}
+
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    remaining = pending.pop(future)
+
+                    for tmp_path, name, is_dir in future.result():
+                        if is_dir:
+                            if remaining > 0:
+                                pending[submit(_scan_dir, tmp_path)] = remaining - 1
+
+                        elif predicate(name, tmp_path):
+                            yield tmp_path
+
     @staticmethod
     def clean_expiry_files_dirs(dir_path, expiry_days: int or float):
 
@@ -174,13 +602,17 @@ class FileUtils:
         current_date_seconds = time()
         expiry_seconds = expiry_days * 24 * 60 ** 2
 
-        for i in listdir(dir_path):
-            path_ = path_join(dir_path, i)
-            create_date_seconds = getctime(path_)
+        with scandir(dir_path) as it:
+            for entry in it:
+                path_ = entry.path
+                create_date_seconds = entry.stat(follow_symlinks=False).st_ctime
 
-            if current_date_seconds - create_date_seconds > expiry_seconds:
-                rmtree(path_)
-                print(f"path: {path_}, deleted.")
+                if current_date_seconds - create_date_seconds > expiry_seconds:
+                    if entry.is_dir(follow_symlinks=False):
+                        rmtree(path_)
+                    else:
+                        remove(path_)
+                    print(f"path: {path_}, deleted.")
 
     @staticmethod
     def get_file_size(file_path: str) -> float:
@@ -188,6 +620,29 @@ class FileUtils:
 
         return round(getsize(file_path) / 1024 ** 2, 2)
 
+    @classmethod
+    def get_dir_size_mb(cls, dir_path: str, depth: int = 0, suffix=None) -> float:
+        """
+        统计 dir_path 目录下文件的总大小，单位：MB
+        :param dir_path:    str     要统计的目录路径
+        :param depth:       int     扫描的深度 0:当前目录，1：当前目录的下一级目录
+        :param suffix:      str     只统计特定后缀的文件，如 ".py" 或者 "py"，多个后缀用 tuple，默认None，没有后缀限制
+        """
+        suffix = cls._normalize_suffix(suffix)
+
+        predicate = cls._build_predicate(suffix)
+        total = 0
+
+        for entry in cls._walk(dir_path, depth):
+            if predicate(entry.name, entry.path):
+                try:
+                    total += entry.stat().st_size
+                except FileNotFoundError:
+                    # 指向不存在目标的符号链接，或扫描后已被删除的文件，不计入
+                    continue
+
+        return round(total / 1024 ** 2, 2)
+
 
 def demo():
     test_path = './'